@@ -10,11 +10,37 @@ Date: 2025
 
 import requests
 import smtplib
+import sys
+import gc
 import time
 import logging
-from datetime import datetime, timezone
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import logging.handlers
+import math
+import functools
+import threading
+import concurrent.futures
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the faster orjson parser when it's installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# resource is Unix-only; the memory check is skipped without it
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Optional: predict passes locally from the ISS orbit to skip idle polling
+try:
+    from skyfield.api import EarthSatellite, load, wgs84
+except ImportError:
+    EarthSatellite = None
 
 # Import configuration
 try:
@@ -27,40 +53,157 @@ except ImportError:
 # Constants
 ISS_API_URL = "http://api.open-notify.org/iss-now.json"
 SUNRISE_API_URL = "https://api.sunrise-sunset.org/json"
+TLE_API_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=TLE"
 CHECK_INTERVAL = 60  # seconds
 POSITION_TOLERANCE = 5  # degrees
+MAX_CHECK_INTERVAL = 600  # seconds
+DAYTIME_BACKOFF = 5  # multiplier on CHECK_INTERVAL when sun times are unknown
+MAX_LONG_SLEEP = 3600  # seconds, so a suspend/resume re-syncs within the hour
+ISS_GROUND_SPEED = 4.0  # degrees per minute (approximate)
+SMTP_KEEPALIVE_INTERVAL = 240  # seconds between SMTP NOOPs
+PASS_LOOKAHEAD = timedelta(hours=12)  # how far ahead to predict passes
+PASS_LEAD_TIME = 120  # seconds before a predicted pass to resume polling
+TLE_MIN_REFETCH_INTERVAL = 7200  # seconds; CelesTrak blocks more frequent downloads
+EARTH_RADIUS_KM = 6371
+ISS_MIN_ALTITUDE_KM = 370  # lower bound of the ISS's orbital altitude
+MEMORY_CHECK_TICKS = 1000  # ticks between memory checks
+MEMORY_WARN_RSS_KB = 200_000  # peak RSS that triggers a collection and warning
+
+# ISS is overhead when the cosine of its great-circle distance exceeds this
+COS_THRESHOLD = math.cos(math.radians(POSITION_TOLERANCE))
+
+# Lowest elevation at which the ISS can be within POSITION_TOLERANCE of us;
+# passes that never climb this high can't trigger a notification
+PASS_MIN_ELEVATION = math.degrees(math.atan2(
+    COS_THRESHOLD - EARTH_RADIUS_KM / (EARTH_RADIUS_KM + ISS_MIN_ALTITUDE_KM),
+    math.sin(math.radians(POSITION_TOLERANCE)),
+))
 
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('iss_tracker.log'),
+        logging.handlers.RotatingFileHandler('iss_tracker.log', maxBytes=1_000_000, backupCount=3),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# In-flight API requests, so concurrent callers share a single fetch
+_inflight = {}  # {key: concurrent.futures.Future}
+_inflight_lock = threading.Lock()
+
+def coalesced_fetch(key, fetch):
+    """Call fetch() unless one is already running for key; share its result"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = concurrent.futures.Future()
+            _inflight[key] = future
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = fetch()
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
 class ISSTracker:
     """ISS Overhead Notifier Class"""
     
+    EMAIL_BODY_TEMPLATE = """
+Hello Space Enthusiast! 🌌
+
+The International Space Station (ISS) is currently passing overhead at your location!
+
+📍 Your Location: {lat:.3f}, {lng:.3f}
+🕐 Time: {ts}
+🌙 Conditions: Nighttime (perfect for viewing!)
+
+Step outside and look up! The ISS appears as a bright, fast-moving star across the sky.
+
+Fun facts:
+• The ISS orbits Earth every ~90 minutes
+• It travels at about 17,500 mph
+• It's about the size of a football field
+• It's the third brightest object in the sky after the Sun and Moon
+
+Happy stargazing! ⭐
+
+---
+Sent by ISS Overhead Notifier
+""".strip()
+    
     def __init__(self):
         self.last_notification = None
         self.notification_cooldown = 3600  # 1 hour between notifications
+        # Fill in the static fields once, leaving {ts} for each send
+        self._body_template = self.EMAIL_BODY_TEMPLATE.format(lat=MY_LAT, lng=MY_LONG, ts="{ts}")
+        # Sun times memoized per (rounded location, UTC date); failures aren't cached
+        self._sun_times_cached = functools.lru_cache(maxsize=8)(self._load_sun_times)
+        self.last_distance = None  # great-circle degrees from ISS at last check
+        self._sin_lat = math.sin(math.radians(MY_LAT))
+        self._cos_lat = math.cos(math.radians(MY_LAT))
+        
+        # Pass prediction state (only used when skyfield is installed)
+        self._orbit_cache = {}  # {utc_date: EarthSatellite}
+        self._orbit_attempted_at = None  # monotonic time of the last TLE request
+        self._orbit_disabled = False  # set when CelesTrak refuses us (403)
+        self._pass_windows = []  # [(start, end)] predicted passes
+        self._pass_horizon = None  # end of the predicted period
+        if EarthSatellite is not None:
+            self._timescale = load.timescale()
+            self._observer = wgs84.latlon(MY_LAT, MY_LONG)
+        
+        # Reuse connections across ticks instead of a new TCP/TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "iss-tracker/1.0"
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Send email off the polling loop so a slow SMTP server can't stall it
+        self._mail_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="smtp"
+        )
+        self._smtp = None  # long-lived connection, only touched on the mail thread
+        self._last_keepalive = time.monotonic()
+        self._last_peak_rss_kb = 0  # peak RSS seen at the last memory check
+        
         logger.info("🛰️  ISS Tracker initialized")
         logger.info(f"📍 Monitoring location: {MY_LAT:.3f}, {MY_LONG:.3f}")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release network resources"""
+        self._mail_pool.submit(self._close_smtp)
+        self._mail_pool.shutdown(wait=True)
+        self.session.close()
+    
     def get_iss_position(self):
         """Fetch current ISS position from API"""
         try:
-            response = requests.get(ISS_API_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            iss_lat = float(data["iss_position"]["latitude"])
-            iss_long = float(data["iss_position"]["longitude"])
-            
-            logger.debug(f"ISS Position: {iss_lat:.3f}, {iss_long:.3f}")
+            iss_lat, iss_long = coalesced_fetch(ISS_API_URL, self._fetch_iss_position)
+            logger.debug("ISS Position: %.3f, %.3f", iss_lat, iss_long)
             return iss_lat, iss_long
             
         except requests.RequestException as e:
@@ -70,48 +213,86 @@ class ISSTracker:
             logger.error(f"Invalid ISS API response: {e}")
             return None, None
     
+    def _fetch_iss_position(self):
+        """Request and parse the ISS position (raises on failure)"""
+        # Close each response so its buffer and connection are released promptly
+        with self.session.get(ISS_API_URL, timeout=10) as response:
+            response.raise_for_status()
+            data = json_loads(response.content)
+        
+        iss_lat = float(data["iss_position"]["latitude"])
+        iss_long = float(data["iss_position"]["longitude"])
+        return iss_lat, iss_long
+    
     def is_iss_overhead(self):
-        """Check if ISS is overhead (within tolerance range)"""
+        """Check if ISS is overhead (within tolerance great-circle distance)"""
         iss_lat, iss_long = self.get_iss_position()
         
         if iss_lat is None or iss_long is None:
+            self.last_distance = None
             return False
         
-        lat_match = (MY_LAT - POSITION_TOLERANCE <= iss_lat <= MY_LAT + POSITION_TOLERANCE)
-        long_match = (MY_LONG - POSITION_TOLERANCE <= iss_long <= MY_LONG + POSITION_TOLERANCE)
+        # Spherical law of cosines: cos of the central angle to the ISS
+        delta_long = math.radians(iss_long - MY_LONG)
+        iss_lat_r = math.radians(iss_lat)
+        cos_c = (self._sin_lat * math.sin(iss_lat_r)
+                 + self._cos_lat * math.cos(iss_lat_r) * math.cos(delta_long))
+        cos_c = max(-1.0, min(1.0, cos_c))
         
-        is_overhead = lat_match and long_match
+        self.last_distance = math.degrees(math.acos(cos_c))
+        is_overhead = cos_c > COS_THRESHOLD
         
         if is_overhead:
             logger.info(f"🎯 ISS is overhead! Position: {iss_lat:.3f}, {iss_long:.3f}")
         else:
-            logger.debug(f"ISS not overhead. Position: {iss_lat:.3f}, {iss_long:.3f}")
+            logger.debug("ISS not overhead. Position: %.3f, %.3f", iss_lat, iss_long)
             
         return is_overhead
     
-    def get_sun_times(self):
-        """Get sunrise and sunset times for current location"""
+    def next_check_interval(self):
+        """Seconds to wait before the next check, based on how far the ISS is"""
+        if self.last_distance is None:
+            return CHECK_INTERVAL
+        
+        # The ISS cannot get within range faster than its ground speed allows
+        minutes_away = (self.last_distance - POSITION_TOLERANCE) / ISS_GROUND_SPEED
+        return max(CHECK_INTERVAL, min(MAX_CHECK_INTERVAL, minutes_away * 60))
+    
+    def daytime_check_interval(self, now, daylight):
+        """Seconds to wait during daytime: until sunset, capped at MAX_LONG_SLEEP"""
+        if daylight is None or daylight[1] is None:
+            return CHECK_INTERVAL * DAYTIME_BACKOFF
+        
+        return min(MAX_LONG_SLEEP, (daylight[1] - now).total_seconds())
+    
+    def check_memory(self):
+        """Collect garbage and warn if the process's peak RSS has grown past the limit"""
+        if resource is None:
+            return
+        
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss_kb //= 1024  # macOS reports bytes
+        
+        # ru_maxrss is a high-water mark, so only react when it has grown
+        grew = peak_rss_kb > self._last_peak_rss_kb
+        self._last_peak_rss_kb = peak_rss_kb
+        
+        if grew and peak_rss_kb > MEMORY_WARN_RSS_KB:
+            collected = gc.collect()
+            logger.warning(f"⚠️  Peak memory {peak_rss_kb / 1024:.0f} MB, "
+                           f"collected {collected} objects")
+    
+    def wait_for_next_tick(self, tick_start, interval):
+        """Sleep out the rest of the interval, minus time already spent on I/O"""
+        elapsed = time.monotonic() - tick_start
+        time.sleep(max(0, interval - elapsed))
+    
+    def get_sun_times(self, now):
+        """Get sunrise and sunset times for current location (cached per UTC day)"""
+        date_key = str(now.date())
         try:
-            params = {
-                "lat": MY_LAT,
-                "lng": MY_LONG,
-                "formatted": 0,
-            }
-            
-            response = requests.get(SUNRISE_API_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Parse UTC times and convert to local hour
-            sunrise_utc = data["results"]["sunrise"]
-            sunset_utc = data["results"]["sunset"]
-            
-            # Extract hour from ISO format (simplified)
-            sunrise_hour = int(sunrise_utc.split("T")[1].split(":")[0])
-            sunset_hour = int(sunset_utc.split("T")[1].split(":")[0])
-            
-            logger.debug(f"Sunrise: {sunrise_hour}:00 UTC, Sunset: {sunset_hour}:00 UTC")
-            return sunrise_hour, sunset_hour
+            return self._sun_times_cached(round(MY_LAT, 2), round(MY_LONG, 2), date_key)
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch sun times: {e}")
@@ -120,22 +301,166 @@ class ISSTracker:
             logger.error(f"Invalid sunrise/sunset API response: {e}")
             return None, None
     
-    def is_nighttime(self):
-        """Check if it's currently nighttime"""
-        sunrise_hour, sunset_hour = self.get_sun_times()
+    def _load_sun_times(self, lat, lng, date_key):
+        """Fetch sun times for a location and UTC date (memoized by get_sun_times)"""
+        sunrise, sunset = coalesced_fetch(
+            (SUNRISE_API_URL, lat, lng, date_key),
+            lambda: self._fetch_sun_times(lat, lng, date_key),
+        )
+        logger.debug("Sunrise: %02d:%02d UTC, Sunset: %02d:%02d UTC",
+                     sunrise.hour, sunrise.minute, sunset.hour, sunset.minute)
+        return sunrise, sunset
+    
+    def _fetch_sun_times(self, lat, lng, date_key):
+        """Request and parse sunrise/sunset times (raises on failure)"""
+        params = {
+            "lat": lat,
+            "lng": lng,
+            "date": date_key,
+            "formatted": 0,
+        }
+        
+        with self.session.get(SUNRISE_API_URL, params=params, timeout=10) as response:
+            response.raise_for_status()
+            data = json_loads(response.content)
+        
+        # Parse full UTC timestamps from ISO format
+        sunrise = datetime.fromisoformat(data["results"]["sunrise"].replace("Z", "+00:00"))
+        sunset = datetime.fromisoformat(data["results"]["sunset"].replace("Z", "+00:00"))
+        return sunrise, sunset
+    
+    def daylight_period(self, now):
+        """Find the daylight period containing the given UTC time
+        
+        Returns (sunrise, sunset) during daytime, (None, None) at night, or
+        None if the sun times couldn't be fetched. A UTC date's sunset can
+        fall on the next UTC day (the Americas) and its sunrise on the
+        previous one (East Asia), so the neighbouring day is checked too.
+        """
+        sunrise, sunset = self.get_sun_times(now)
+        if sunrise is None or sunset is None:
+            return None
         
-        if sunrise_hour is None or sunset_hour is None:
+        if sunrise <= now <= sunset:
+            return sunrise, sunset
+        
+        neighbour = now - timedelta(days=1) if now < sunrise else now + timedelta(days=1)
+        sunrise, sunset = self.get_sun_times(neighbour)
+        if sunrise is None or sunset is None:
+            return None
+        
+        if sunrise <= now <= sunset:
+            return sunrise, sunset
+        return None, None
+    
+    def is_nighttime(self, now, daylight):
+        """Check if it's nighttime, given daylight_period(now)"""
+        if daylight is None:
             logger.warning("⚠️  Could not determine sun times, assuming daytime")
             return False
         
-        current_hour = datetime.now(timezone.utc).hour
+        is_night = daylight == (None, None)
         
-        # Check if current time is after sunset or before sunrise
-        is_night = current_hour >= sunset_hour or current_hour <= sunrise_hour
-        
-        logger.debug(f"Current hour: {current_hour} UTC, Night: {is_night}")
+        logger.debug("Current time: %02d:%02d UTC, Night: %s", now.hour, now.minute, is_night)
         return is_night
     
+    def get_iss_orbit(self, now):
+        """Get the ISS orbit from its latest TLE (cached per UTC day)"""
+        today = now.date()
+        if today in self._orbit_cache:
+            return self._orbit_cache[today]
+        
+        # A stale orbit is still good for days; fall back to it when we can't refetch
+        stale = next(iter(self._orbit_cache.values()), None)
+        if self._orbit_disabled:
+            return stale
+        if (self._orbit_attempted_at is not None
+                and time.monotonic() - self._orbit_attempted_at < TLE_MIN_REFETCH_INTERVAL):
+            return stale
+        self._orbit_attempted_at = time.monotonic()
+        
+        try:
+            satellite = coalesced_fetch(TLE_API_URL, self._fetch_iss_orbit)
+            self._orbit_cache = {today: satellite}
+            self._pass_horizon = None  # new orbit, predictions are stale
+            return satellite
+            
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 403:
+                logger.error("❌ CelesTrak refused the TLE request (403), disabling pass prediction")
+                self._orbit_disabled = True
+            else:
+                logger.error(f"Failed to fetch ISS orbit: {e}")
+            return stale
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch ISS orbit: {e}")
+            return stale
+        except ValueError as e:
+            logger.error(f"Invalid ISS TLE response: {e}")
+            return stale
+    
+    def _fetch_iss_orbit(self):
+        """Request and parse the ISS TLE (raises on failure)"""
+        with self.session.get(TLE_API_URL, timeout=10) as response:
+            response.raise_for_status()
+            lines = response.text.strip().splitlines()
+        
+        if len(lines) < 3:
+            raise ValueError(f"expected 3 TLE lines, got {len(lines)}")
+        name, line1, line2 = (line.strip() for line in lines[:3])
+        return EarthSatellite(line1, line2, name, self._timescale)
+    
+    def next_pass_start(self, now):
+        """Start of the next predicted pass high enough to be overhead
+        
+        Returns the current time if a pass is under way, the end of the
+        prediction period if no pass is expected before then, or None if
+        passes can't be predicted (skyfield missing or TLE unavailable).
+        """
+        if EarthSatellite is None:
+            return None
+        
+        satellite = self.get_iss_orbit(now)
+        if satellite is None:
+            return None
+        
+        if self._pass_horizon is None or now >= self._pass_horizon:
+            self._predict_passes(satellite, now)
+        
+        for start, end in self._pass_windows:
+            if end >= now:
+                return max(start, now)
+        return self._pass_horizon
+    
+    def _predict_passes(self, satellite, now):
+        """Compute pass windows above PASS_MIN_ELEVATION for PASS_LOOKAHEAD"""
+        horizon = now + PASS_LOOKAHEAD
+        t0 = self._timescale.from_datetime(now)
+        t1 = self._timescale.from_datetime(horizon)
+        times, events = satellite.find_events(
+            self._observer, t0, t1, altitude_degrees=PASS_MIN_ELEVATION
+        )
+        
+        # Events are 0 = rise, 1 = culminate, 2 = set
+        windows = []
+        start = None
+        last_event = None
+        for t, event in zip(times, events):
+            if event == 0:
+                start = t.utc_datetime()
+            elif start is None:
+                start = now  # pass already under way at t0
+            if event == 2:
+                windows.append((start, t.utc_datetime()))
+                start = None
+            last_event = event
+        if last_event in (0, 1):
+            windows.append((start, horizon))
+        
+        self._pass_windows = windows
+        self._pass_horizon = horizon
+        logger.debug("Predicted %d pass(es) in the next %s", len(windows), PASS_LOOKAHEAD)
+    
     def should_send_notification(self):
         """Check if enough time has passed since last notification"""
         if self.last_notification is None:
@@ -144,95 +469,153 @@ class ISSTracker:
         time_since_last = time.time() - self.last_notification
         return time_since_last > self.notification_cooldown
     
-    def send_email_notification(self):
-        """Send email notification about ISS overhead"""
+    def send_email_notification(self, now):
+        """Queue an email notification about ISS overhead"""
         if not self.should_send_notification():
             logger.info("⏰ Skipping notification (cooldown active)")
             return False
         
         try:
             # Create message
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = MY_EMAIL
             msg['To'] = TO_EMAIL
             msg['Subject'] = "🛰️ ISS is Overhead!"
             
-            # Email body
-            body = f"""
-Hello Space Enthusiast! 🌌
-
-The International Space Station (ISS) is currently passing overhead at your location!
-
-📍 Your Location: {MY_LAT:.3f}, {MY_LONG:.3f}
-🕐 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-🌙 Conditions: Nighttime (perfect for viewing!)
-
-Step outside and look up! The ISS appears as a bright, fast-moving star across the sky.
-
-Fun facts:
-• The ISS orbits Earth every ~90 minutes
-• It travels at about 17,500 mph
-• It's about the size of a football field
-• It's the third brightest object in the sky after the Sun and Moon
-
-Happy stargazing! ⭐
-
----
-Sent by ISS Overhead Notifier
-            """.strip()
-            
-            msg.attach(MIMEText(body, 'plain'))
+            # Email body: only the timestamp changes between sends
+            body = self._body_template.format(ts=now.astimezone().strftime('%Y-%m-%d %H:%M:%S'))
             
-            # Send email
-            with smtplib.SMTP("smtp.gmail.com", 587) as server:
-                server.starttls()
-                server.login(MY_EMAIL, MY_PASSWORD)
-                server.send_message(msg)
+            msg.set_content(body)
             
+            # Start the cooldown now so a send still in flight isn't repeated
             self.last_notification = time.time()
-            logger.info(f"📧 Email notification sent to {TO_EMAIL}")
+            future = self._mail_pool.submit(self._do_send, msg)
+            future.add_done_callback(self._on_send_done)
             return True
             
-        except smtplib.SMTPAuthenticationError:
-            logger.error("❌ Email authentication failed. Check your email/password settings.")
-            return False
-        except smtplib.SMTPException as e:
-            logger.error(f"❌ Failed to send email: {e}")
-            return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error sending email: {e}")
+            logger.error(f"❌ Unexpected error preparing email: {e}")
             return False
     
+    def _ensure_smtp(self):
+        """Connect and log in to the SMTP server unless already connected"""
+        if self._smtp is not None:
+            return
+        
+        server = smtplib.SMTP("smtp.gmail.com", 587, timeout=30)
+        try:
+            server.starttls()
+            server.login(MY_EMAIL, MY_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+    
+    def _close_smtp(self):
+        """Close the SMTP connection, if any"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def _do_send(self, msg):
+        """Send a prepared message over SMTP (runs on the mail thread)"""
+        self._ensure_smtp()
+        try:
+            self._smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection; reconnect once and retry
+            self._smtp.close()
+            self._smtp = None
+            self._ensure_smtp()
+            self._smtp.send_message(msg)
+    
+    def _smtp_keepalive(self):
+        """Keep the SMTP connection warm, dropping it if it went stale"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.noop()
+        except (smtplib.SMTPException, OSError):
+            # Don't reconnect here; _do_send reconnects lazily when needed
+            logger.debug("SMTP connection lost, closing it")
+            self._smtp.close()
+            self._smtp = None
+    
+    def _on_send_done(self, future):
+        """Log the outcome of a background email send"""
+        error = future.exception()
+        if error is None:
+            logger.info(f"📧 Email notification sent to {TO_EMAIL}")
+            return
+        
+        # The send failed, so lift the cooldown and let the next tick retry
+        self.last_notification = None
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            logger.error("❌ Email authentication failed. Check your email/password settings.")
+        elif isinstance(error, smtplib.SMTPException):
+            logger.error(f"❌ Failed to send email: {error}")
+        else:
+            logger.error(f"❌ Unexpected error sending email: {error}")
+    
     def run(self):
         """Main tracking loop"""
         logger.info("🚀 Starting ISS tracking...")
-        logger.info(f"⏱️  Checking every {CHECK_INTERVAL} seconds")
+        logger.info(f"⏱️  Checking every {CHECK_INTERVAL}-{MAX_CHECK_INTERVAL} seconds")
         logger.info("Press Ctrl+C to stop")
         
+        tick_count = 0
         try:
             while True:
                 logger.debug("🔍 Checking ISS position...")
+                tick_count += 1
+                if tick_count % MEMORY_CHECK_TICKS == 0:
+                    self.check_memory()
+                tick_start = time.monotonic()
+                now = datetime.now(timezone.utc)  # single clock read per tick
                 
-                # Check conditions
-                iss_overhead = self.is_iss_overhead()
-                is_night = self.is_nighttime()
+                if tick_start - self._last_keepalive >= SMTP_KEEPALIVE_INTERVAL:
+                    self._mail_pool.submit(self._smtp_keepalive)
+                    self._last_keepalive = tick_start
                 
-                if iss_overhead and is_night:
+                # Check nighttime first: it's cached, and no notification
+                # can fire during daytime, so skip the ISS fetch entirely
+                daylight = self.daylight_period(now)
+                if not self.is_nighttime(now, daylight):
+                    next_sleep = self.daytime_check_interval(now, daylight)
+                    logger.debug("☀️  Daytime, sleeping %.0f seconds", next_sleep)
+                    self.wait_for_next_tick(tick_start, next_sleep)
+                    continue
+                
+                # Sleep until shortly before the next predicted pass
+                pass_start = self.next_pass_start(now)
+                if pass_start is not None:
+                    until_pass = (pass_start - now).total_seconds()
+                    if until_pass - PASS_LEAD_TIME > CHECK_INTERVAL:
+                        next_sleep = min(MAX_LONG_SLEEP, until_pass - PASS_LEAD_TIME)
+                        logger.debug("🔭 No pass expected, sleeping %.0f seconds", next_sleep)
+                        self.wait_for_next_tick(tick_start, next_sleep)
+                        continue
+                
+                if self.is_iss_overhead():
                     logger.info("🎉 ISS is overhead during nighttime!")
-                    success = self.send_email_notification()
+                    success = self.send_email_notification(now)
                     if success:
-                        logger.info("✅ Notification sent successfully")
+                        logger.info("✅ Notification queued")
                     else:
-                        logger.warning("⚠️  Failed to send notification")
-                elif iss_overhead:
-                    logger.info("☀️  ISS is overhead but it's daytime")
-                elif is_night:
-                    logger.debug("🌙 It's nighttime but ISS is not overhead")
+                        logger.warning("⚠️  Notification not sent")
                 else:
-                    logger.debug("☀️  Daytime and ISS not overhead")
+                    logger.debug("🌙 It's nighttime but ISS is not overhead")
                 
                 # Wait before next check
-                time.sleep(CHECK_INTERVAL)
+                next_sleep = self.next_check_interval()
+                logger.debug("💤 Next check in %.0f seconds", next_sleep)
+                self.wait_for_next_tick(tick_start, next_sleep)
                 
         except KeyboardInterrupt:
             logger.info("\n👋 ISS Tracker stopped by user")
@@ -269,8 +652,8 @@ def main():
         return
     
     # Start tracking
-    tracker = ISSTracker()
-    tracker.run()
+    with ISSTracker() as tracker:
+        tracker.run()
 
 if __name__ == "__main__":
     main()